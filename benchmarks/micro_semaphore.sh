@@ -4,3 +4,7 @@ PYTHON=${PYTHON:=python}
 $PYTHON -mpyperf timeit  -s'from gevent.lock import Semaphore; s = Semaphore()' 's.release()'
 $PYTHON -mpyperf timeit  -s'from gevent.lock import Semaphore; from gevent import spawn_raw; s = Semaphore(0)' 'spawn_raw(s.release); s.acquire()'
 $PYTHON -mpyperf timeit  -s'from gevent.lock import Semaphore; from gevent import spawn_raw; s = Semaphore(0)' 'spawn_raw(s.release); spawn_raw(s.release); spawn_raw(s.release); spawn_raw(s.release); s.acquire(); s.acquire(); s.acquire(); s.acquire()'
+$PYTHON -mpyperf timeit  -s'from gevent.lock import DummySemaphore; s = DummySemaphore()' 's.acquire(); s.release()'
+$PYTHON -mpyperf timeit  -s'from gevent.lock import DummySemaphore; s = DummySemaphore()' 'with s: pass'
+$PYTHON -mpyperf timeit  -s'from gevent.lock import RLock; l = RLock()' 'with l: pass'
+$PYTHON -mpyperf timeit  -s'from gevent.lock import RLock; from gevent import spawn, sleep; l = RLock()' -s'def f():' -s'    with l: pass' 'l.acquire(); g = spawn(f); sleep(); l.release(); g.join()'
@@ -0,0 +1,5 @@
+Calling ``gevent.lock.DummySemaphore()`` now returns a single shared
+instance instead of creating a new object each time. This avoids an
+allocation for each unbounded ``gevent.pool.Pool`` and each
+``FileObjectThread`` created without locking. Subclasses of
+``DummySemaphore`` still create a new instance for each call.
@@ -0,0 +1,7 @@
+When gevent runs without its C extensions on CPython (that is, with
+``PURE_PYTHON`` set), ``gevent.lock.Semaphore`` and
+``gevent.lock.BoundedSemaphore`` now use ``fastrlock.rlock.FastRLock``
+for their internal native thread lock if the optional ``fastrlock``
+package is installed. This makes each semaphore operation faster. If
+``fastrlock`` isn't installed, and always on PyPy, a pure-Python lock
+is used as before.
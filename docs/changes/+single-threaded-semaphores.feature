@@ -0,0 +1,7 @@
+Add the ``gevent.config.single_threaded_semaphores`` setting (environment
+variable ``GEVENT_SINGLE_THREADED_SEMAPHORES``). When gevent runs without
+its C extensions, such as on PyPy, enabling it removes the native thread
+lock that otherwise guards each semaphore operation. This also removes
+that guard from ``gevent.lock.RLock`` and from the monkey-patched
+``threading`` and ``_thread`` locks. It is only safe if no other native
+thread, including a threadpool worker, takes any of those locks.
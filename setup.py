@@ -421,6 +421,10 @@ def run_setup(ext_modules):
 
                 # We still have some places we like to test with pkg_resources
                 'setuptools',
+
+                # The pure-Python semaphores use this if it's installed;
+                # make sure its tests aren't skipped. It's not used on PyPy.
+                'fastrlock ; platform_python_implementation == "CPython"',
             ],
         },
         # It's always safe to pass the CFFI keyword, even if
@@ -492,6 +492,44 @@ class TrackGreenletTree(BoolSettingMixin, Setting):
     """
 
 
+class SingleThreadedSemaphores(BoolSettingMixin, Setting):
+    name = 'single_threaded_semaphores'
+    environment_key = 'GEVENT_SINGLE_THREADED_SEMAPHORES'
+    default = False
+
+    desc = """\
+    Should the pure-Python semaphores skip their native thread lock?
+
+    When gevent isn't using its C extensions (always the case on PyPy,
+    or when the ``PURE_PYTHON`` environment variable is set), each
+    `gevent.lock.Semaphore` and `gevent.lock.BoundedSemaphore` holds a
+    native thread lock during each operation, just as the compiled
+    versions hold the GIL. Setting this to a true value avoids the
+    cost of that lock.
+
+    This affects much more than the semaphores you create yourself.
+    `gevent.lock.RLock` is built on a semaphore, and the lock type
+    that :mod:`gevent.monkey` installs for :mod:`threading` and
+    :mod:`_thread` is a ``BoundedSemaphore``. After monkey-patching,
+    every ``threading.Lock``, ``threading.RLock`` and
+    ``_thread.allocate_lock()`` also loses its guard, including
+    module-level locks in the standard library such as the one used
+    by :mod:`logging`.
+
+    .. caution:: It is unsafe to enable this if native threads,
+       including the worker threads of a `gevent.threadpool.ThreadPool`
+       (which is used, for example, by the default resolver), run any
+       code that takes one of those locks. Only enable it if no
+       native thread other than the one running the hub ever touches
+       a gevent semaphore or a monkey-patched lock.
+
+    This has no effect when the C extensions are in use. It must be
+    set before :mod:`gevent.lock` is first imported.
+
+    .. versionadded:: NEXT
+    """
+
+
 ## Monitoring settings
 # All env keys should begin with GEVENT_MONITOR
 
@@ -11,7 +11,10 @@ from __future__ import absolute_import
 from __future__ import print_function
 
 from gevent.hub import getcurrent
+from gevent._config import config as GEVENT_CONFIG
 from gevent._compat import PURE_PYTHON
+from gevent._compat import PYPY
+from gevent._compat import thread_mod_name
 
 # This is the one exception to the rule of where to
 # import Semaphore, obviously
@@ -39,18 +42,14 @@ __all__ = [
 # also hold for PURE_PYTHON mode when no optional C extensions are
 # used.
 
+# Note that these must come from gevent.monkey, not a plain import:
+# if we're imported after ``_thread`` has been patched, that would
+# give us the gevent versions.
 _allocate_lock, _get_ident = monkey.get_original(
-    ('_thread', 'thread'),
+    thread_mod_name,
     ('allocate_lock', 'get_ident')
 )
 
-def atomic(meth):
-    def m(self, *args):
-        with self._atomic:
-            return meth(self, *args)
-    return m
-
-
 class _GILLock(object):
     __slots__ = (
         '_owned_thread_id',
@@ -71,29 +70,40 @@ class _GILLock(object):
         self._atomic = _allocate_lock()
         self._recursion_depth = 0
 
-    @atomic
-    def acquire(self):
+    def acquire(self, *, _get_ident=_get_ident):
         current_tid = _get_ident()
         if self._owned_thread_id == current_tid:
+            # Re-entry. Only the owning thread can have stored its own
+            # id here, and only it can change that again, so this
+            # check doesn't need the protection of ``_atomic``.
             self._recursion_depth += 1
             return True
+        return self._acquire_not_owned(current_tid)
 
+    def _acquire_not_owned(self, current_tid):
         # Not owned by this thread. Only one thread will make it through this point.
-        while 1:
-            self._atomic.release()
-            try:
-                self._gil.acquire()
-            finally:
-                self._atomic.acquire()
-            if self._owned_thread_id is None:
-                break
-
-        self._owned_thread_id = current_tid
-        self._recursion_depth = 1
+        with self._atomic:
+            # If nobody holds the lock, which is the usual case, we can
+            # take it without having to drop and re-take ``_atomic``.
+            if not self._gil.acquire(False):
+                while 1:
+                    self._atomic.release()
+                    try:
+                        self._gil.acquire()
+                    finally:
+                        self._atomic.acquire()
+                    if self._owned_thread_id is None:
+                        break
+
+            self._owned_thread_id = current_tid
+            self._recursion_depth = 1
         return True
 
-    @atomic
-    def release(self):
+    def release(self, *, _get_ident=_get_ident):
+        # Like the re-entry check in ``acquire``, this doesn't need
+        # ``_atomic``: only the owning thread gets past the check
+        # below, and it clears the owner before releasing the
+        # underlying lock, which is what other threads wait on.
         current_tid = _get_ident()
         if current_tid != self._owned_thread_id:
             raise RuntimeError("%s: Releasing lock not owned by you. You: 0x%x; Owner: 0x%x" % (
@@ -116,6 +126,29 @@ class _GILLock(object):
     def locked(self):
         return self._gil.locked()
 
+
+try:
+    if PYPY:
+        # On PyPy, fastrlock is a cpyext extension; calling into that
+        # for every semaphore operation would be slower than letting
+        # the JIT handle _GILLock.
+        raise ImportError
+    # If available, prefer the C implementation of a reentrant lock
+    # from the ``fastrlock`` package. It has the same semantics as
+    # _GILLock (it is owned by a thread, not a greenlet, and can be
+    # re-entered by that thread), but the uncontended case of
+    # acquire and release is handled entirely in C, which matters
+    # because this lock guards every semaphore operation.
+    #
+    # Note that there's no point in compiling _GILLock (or the
+    # _Atomic classes) with Cython ourself: they're only used when
+    # PURE_PYTHON is in effect, and in that case our own C
+    # accelerator modules are never imported.
+    from fastrlock.rlock import FastRLock as _AtomicLock
+except ImportError:
+    _AtomicLock = _GILLock
+
+
 class _AtomicSemaphoreMixin(object):
     # Behaves as though the GIL was held for the duration of acquire, wait,
     # and release, just as if we were in Cython.
@@ -125,52 +158,88 @@ class _AtomicSemaphoreMixin(object):
     # and re-acquire it for them on exit.
     #
     # Note that this does *NOT*, in-and-of itself, make semaphores safe to use from multiple threads
+    #
+    # Because these wrappers are on the hot path of every semaphore
+    # operation, they avoid the context manager protocol and
+    # ``super()``. Instead, the bound methods of the lock are cached
+    # on the instance, and each concrete subclass provides the
+    # unbound implementations of the semaphore class it extends.
     __slots__ = ()
+
     def __init__(self, *args, **kwargs):
-        self._lock_lock = _GILLock() # pylint:disable=assigning-non-slot
+        # pylint:disable=assigning-non-slot
+        self._lock_lock = lock_lock = _AtomicLock()
+        self._lock_acquire = lock_lock.acquire
+        self._lock_release = lock_lock.release
         super(_AtomicSemaphoreMixin, self).__init__(*args, **kwargs)
 
     def _acquire_lock_for_switch_in(self):
-        self._lock_lock.acquire()
+        self._lock_acquire()
 
     def _drop_lock_for_switch_out(self):
-        self._lock_lock.release()
+        self._lock_release()
 
     def _notify_links(self, arrived_while_waiting):
-        with self._lock_lock:
-            return super(_AtomicSemaphoreMixin, self)._notify_links(arrived_while_waiting)
+        self._lock_acquire()
+        try:
+            return self._base_notify_links(self, arrived_while_waiting)
+        finally:
+            self._lock_release()
 
     def release(self):
-        with self._lock_lock:
-            return super(_AtomicSemaphoreMixin, self).release()
+        self._lock_acquire()
+        try:
+            return self._base_release(self)
+        finally:
+            self._lock_release()
 
     def acquire(self, blocking=True, timeout=None):
-        with self._lock_lock:
-            return super(_AtomicSemaphoreMixin, self).acquire(blocking, timeout)
+        self._lock_acquire()
+        try:
+            return self._base_acquire(self, blocking, timeout)
+        finally:
+            self._lock_release()
 
     _py3k_acquire = acquire
 
     def wait(self, timeout=None):
-        with self._lock_lock:
-            return super(_AtomicSemaphoreMixin, self).wait(timeout)
+        self._lock_acquire()
+        try:
+            return self._base_wait(self, timeout)
+        finally:
+            self._lock_release()
 
 class _AtomicSemaphore(_AtomicSemaphoreMixin, Semaphore):
     __doc__ = Semaphore.__doc__
     __slots__ = (
         '_lock_lock',
+        '_lock_acquire',
+        '_lock_release',
     )
 
+    _base_notify_links = staticmethod(Semaphore._notify_links)
+    _base_release = staticmethod(Semaphore.release)
+    _base_acquire = staticmethod(Semaphore.acquire)
+    _base_wait = staticmethod(Semaphore.wait)
+
 
 class _AtomicBoundedSemaphore(_AtomicSemaphoreMixin, BoundedSemaphore):
     __doc__ = BoundedSemaphore.__doc__
     __slots__ = (
         '_lock_lock',
+        '_lock_acquire',
+        '_lock_release',
     )
 
-    def release(self): # pylint:disable=useless-super-delegation
+    _base_notify_links = staticmethod(BoundedSemaphore._notify_links)
+    _base_release = staticmethod(BoundedSemaphore.release)
+    _base_acquire = staticmethod(BoundedSemaphore.acquire)
+    _base_wait = staticmethod(BoundedSemaphore.wait)
+
+    def release(self):
         # This method is duplicated here so that it can get
         # properly documented.
-        return super(_AtomicBoundedSemaphore, self).release()
+        return _AtomicSemaphoreMixin.release(self)
 
 
 def _fixup_docstrings():
@@ -187,7 +256,7 @@ _fixup_docstrings()
 del _fixup_docstrings
 
 
-if PURE_PYTHON:
+if PURE_PYTHON and not GEVENT_CONFIG.single_threaded_semaphores:
     Semaphore = _AtomicSemaphore
     Semaphore.__name__ = 'Semaphore'
     BoundedSemaphore = _AtomicBoundedSemaphore
@@ -214,6 +283,13 @@ class DummySemaphore(object):
     underlying object is known to be thread-safe itself mutual
     exclusion is not needed and a ``DummySemaphore`` can be used, but
     if that's not true, use a real ``Semaphore``.
+
+    .. versionchanged:: NEXT
+       Because all instances behave identically, calling this class
+       returns a single shared instance. Subclasses are not affected.
+       Instances also no longer have a ``__dict__``, so arbitrary
+       attributes can't be set on them (which would affect all users
+       of the shared instance).
     """
 
     # Internally this is used for exactly the purpose described in the
@@ -223,6 +299,16 @@ class DummySemaphore(object):
     # determines whether it should lock around IO to the underlying
     # file object.
 
+    __slots__ = (
+        # Instances could always be weakly referenced, keep it that way.
+        '__weakref__',
+    )
+
+    def __new__(cls, *args, **kwargs): # pylint:disable=unused-argument
+        if cls is DummySemaphore:
+            return _DUMMY_SEMAPHORE
+        return object.__new__(cls)
+
     def __init__(self, value=None):
         """
         .. versionchanged:: 1.1rc3
@@ -271,6 +357,8 @@ class DummySemaphore(object):
     def __exit__(self, typ, val, tb):
         pass
 
+_DUMMY_SEMAPHORE = object.__new__(DummySemaphore)
+
 
 class RLock(object):
     """
@@ -290,6 +378,8 @@ class RLock(object):
         '_block',
         '_owner',
         '_count',
+        # This class is patched in as ``threading.RLock``, and the
+        # native RLock supports weak references, so we must too.
         '__weakref__',
     )
 
@@ -310,8 +400,10 @@ class RLock(object):
             self._count,
             self._owner)
 
-    def acquire(self, blocking=True, timeout=None):
+    def acquire(self, blocking=True, timeout=None, *, _getcurrent=getcurrent):
         """
+        acquire(blocking=True, timeout=None) -> bool
+
         Acquire the mutex, blocking if *blocking* is true, for up to
         *timeout* seconds.
 
@@ -320,10 +412,20 @@ class RLock(object):
 
         :return: A boolean indicating whether the mutex was acquired.
         """
-        me = getcurrent()
+        me = _getcurrent()
         if self._owner is me:
             self._count += 1
             return 1
+        if not blocking and self._owner is not None:
+            # Claimed by someone else. The owner is only set
+            # after ``_block`` has been acquired, and cleared before it
+            # is released, so we already know what the semaphore would
+            # tell us.
+            return False
+        # Even if no one owns the lock, we can't claim it just by
+        # setting ``_owner``: ``_block`` is what other greenlets, and
+        # other threads, wait on, and the check-then-set wouldn't be
+        # atomic between threads anyway.
         rc = self._block.acquire(blocking, timeout)
         if rc:
             self._owner = me
@@ -333,16 +435,18 @@ class RLock(object):
     def __enter__(self):
         return self.acquire()
 
-    def release(self):
+    def release(self, *, _getcurrent=getcurrent):
         """
+        release() -> None
+
         Release the mutex.
 
         Only the greenlet that originally acquired the mutex can
         release it.
         """
-        if self._owner is not getcurrent():
+        if self._owner is not _getcurrent():
             raise RuntimeError("cannot release un-acquired lock. Owner: %r Current: %r" % (
-                self._owner, getcurrent()
+                self._owner, _getcurrent()
             ))
         self._count = count = self._count - 1 # pylint:disable=consider-using-augmented-assign
         if not count:
@@ -352,7 +456,11 @@ class RLock(object):
     def __exit__(self, typ, value, tb):
         self.release()
 
-    # Internal methods used by condition variables
+    # Internal methods used by condition variables.
+    #
+    # While the condition waits, some other greenlet or thread must be
+    # able to acquire this lock in order to notify it, so the release of
+    # ``_block`` can't be elided, or deferred until we re-acquire.
 
     def _acquire_restore(self, count_owner):
         count, owner = count_owner
@@ -368,5 +476,5 @@ class RLock(object):
         self._block.release()
         return (count, owner)
 
-    def _is_owned(self):
-        return self._owner is getcurrent()
+    def _is_owned(self, *, _getcurrent=getcurrent):
+        return self._owner is _getcurrent()
@@ -2,6 +2,9 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import weakref
+
+import gevent
 from gevent import lock
 
 
@@ -9,6 +12,26 @@ import gevent.testing as greentest
 from gevent.tests import test__semaphore
 
 
+class TestRLock(greentest.TestCase):
+
+    def test_acquire_nonblocking_owned_by_other_greenlet(self):
+        rlock = lock.RLock()
+        self.assertTrue(rlock.acquire())
+        try:
+            result = gevent.spawn(rlock.acquire, False).get()
+            self.assertFalse(result)
+            self.assertIs(rlock._owner, gevent.getcurrent())
+        finally:
+            rlock.release()
+
+        self.assertTrue(gevent.spawn(rlock.acquire, False).get())
+
+    def test_rlock_weakref(self):
+        rlock = lock.RLock()
+        r = weakref.ref(rlock)
+        self.assertIs(rlock, r())
+
+
 class TestRLockMultiThread(test__semaphore.TestSemaphoreMultiThread):
 
     def _makeOne(self):
@@ -7,12 +7,22 @@
 from __future__ import print_function
 from __future__ import absolute_import
 
+import os
+import subprocess
+import sys
 import weakref
 
 import gevent
 import gevent.exceptions
 from gevent.lock import Semaphore
 from gevent.lock import BoundedSemaphore
+from gevent.lock import DummySemaphore
+from gevent import lock
+
+try:
+    from fastrlock.rlock import FastRLock
+except ImportError:
+    FastRLock = None
 
 import gevent.testing as greentest
 from gevent.testing import timing
@@ -68,6 +78,36 @@ class TestSemaphore(greentest.TestCase):
         gevent.wait([s])
 
 
+class TestDummySemaphore(greentest.TestCase):
+
+    def test_shared_instance(self):
+        self.assertIs(DummySemaphore(), DummySemaphore(1))
+
+    def test_subclass_instances_not_shared(self):
+        class MySemaphore(DummySemaphore):
+            pass
+
+        self.assertIsNot(MySemaphore(), MySemaphore())
+        self.assertIsNot(MySemaphore(), DummySemaphore())
+
+        class SemaphoreWithArgs(DummySemaphore):
+            def __init__(self, a, b=None): # pylint:disable=super-init-not-called
+                self.args = (a, b)
+
+        sem = SemaphoreWithArgs(1, b=2)
+        self.assertEqual(sem.args, (1, 2))
+        self.assertIsNot(sem, SemaphoreWithArgs(1, 2))
+
+    def test_no_dict(self):
+        with self.assertRaises(AttributeError):
+            DummySemaphore().some_attribute = 42 # pylint:disable=assigning-non-slot
+
+    def test_weakref(self):
+        sem = DummySemaphore()
+        r = weakref.ref(sem)
+        self.assertIs(sem, r())
+
+
 class TestSemaphoreMultiThread(greentest.TestCase):
     # Tests that the object can be acquired correctly across
     # multiple threads.
@@ -89,7 +129,6 @@ class TestSemaphoreMultiThread(greentest.TestCase):
                         acquired, exc_info,
                         **thread_acquire_kwargs):
         from gevent._hub_local import get_hub_if_exists
-        import sys
 
         def thread_main():
             thread_running.set()
@@ -329,6 +368,78 @@ class TestBoundedSemaphoreMultiThread(TestSemaphoreMultiThread):
     def _getTargetClass(self):
         return BoundedSemaphore
 
+class _AtomicLockMixin(object):
+    # Run the multi-threaded tests against the semaphores used in
+    # PURE_PYTHON mode, with a particular implementation of the lock
+    # that makes their operations atomic.
+
+    atomic_lock = None
+    target_class = None
+
+    def setUp(self):
+        super(_AtomicLockMixin, self).setUp()
+        self.addCleanup(setattr, lock, '_AtomicLock', lock._AtomicLock)
+        lock._AtomicLock = self.atomic_lock
+
+    def _getTargetClass(self):
+        return self.target_class
+
+    def _makeOne(self):
+        sem = super(_AtomicLockMixin, self)._makeOne()
+        self.assertIsInstance(sem._lock_lock, self.atomic_lock)
+        return sem
+
+
+class TestAtomicSemaphoreGILLockMultiThread(_AtomicLockMixin,
+                                            TestSemaphoreMultiThread):
+    atomic_lock = lock._GILLock
+    target_class = lock._AtomicSemaphore
+
+
+class TestAtomicBoundedSemaphoreGILLockMultiThread(_AtomicLockMixin,
+                                                   TestSemaphoreMultiThread):
+    atomic_lock = lock._GILLock
+    target_class = lock._AtomicBoundedSemaphore
+
+
+@greentest.skipIf(FastRLock is None, "Needs fastrlock")
+class TestAtomicSemaphoreFastRLockMultiThread(_AtomicLockMixin,
+                                              TestSemaphoreMultiThread):
+    atomic_lock = FastRLock
+    target_class = lock._AtomicSemaphore
+
+
+@greentest.skipIf(FastRLock is None, "Needs fastrlock")
+class TestAtomicBoundedSemaphoreFastRLockMultiThread(_AtomicLockMixin,
+                                                     TestSemaphoreMultiThread):
+    atomic_lock = FastRLock
+    target_class = lock._AtomicBoundedSemaphore
+
+
+class TestSingleThreadedSemaphores(greentest.TestCase):
+
+    def _check_atomic(self, **env):
+        env = dict(os.environ, PURE_PYTHON='1', **env)
+        output = subprocess.check_output(
+            [sys.executable, '-c',
+             'from gevent.lock import Semaphore, BoundedSemaphore;'
+             'print(hasattr(Semaphore(), "_lock_lock"),'
+             '      hasattr(BoundedSemaphore(), "_lock_lock"))'],
+            env=env
+        )
+        return output.decode('ascii').strip()
+
+    def test_default_uses_lock(self):
+        self.assertEqual(
+            self._check_atomic(GEVENT_SINGLE_THREADED_SEMAPHORES='0'),
+            'True True')
+
+    def test_single_threaded_has_no_lock(self):
+        self.assertEqual(
+            self._check_atomic(GEVENT_SINGLE_THREADED_SEMAPHORES='1'),
+            'False False')
+
+
 @greentest.skipOnPurePython("Needs C extension")
 class TestCExt(greentest.TestCase):
 